@@ -5,21 +5,45 @@
   (биржи, сеть, лимитеры, БД и т.п.).
 - Доменные ошибки определяются в доменном слое основного приложения и не
   импортируются здесь, чтобы не нарушать зависимость направленности.
+
+Экземпляры исключений не переиспользуются между ``raise``: интерпретатор дописывает
+кадры в ``__traceback__`` и выставляет ``__context__`` у того же объекта, а маппер
+ошибок дополняет поля контекстом вызова, поэтому каждый ``raise`` создаёт новый объект.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, field
+from enum import StrEnum
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar, Final
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
 
-class ErrorCode(Enum):
-    """Коды ошибок инфраструктурного уровня SDK."""
+# Шаблоны сообщений: %-форматирование собирает строку за одну операцию
+_TICKER_FMT: Final = "Не удалось получить тикер для символа %s, биржа %s"
+_FUNDING_RATE_FMT: Final = "Нет ставки funding для %s на %s"
+_POSITION_FMT: Final = "Нет позиции для %s на %s"
+_INSTRUMENT_FMT: Final = "Нет инструмента для %s на %s"
+_TRIGGER_ORDERS_FMT: Final = "Нет данных по триггер‑ордерам для %s на %s"
+_BALANCE_FMT: Final = "Нет баланса для %s на %s"
+_UNSUPPORTED_FEATURE_FMT: Final = "Функция %s не поддерживается биржей %s для параметров %s"
+_ORDER_FMT: Final = "Нет данных по ордеру для %s на %s"
+_FEE_FMT: Final = "Нет данных по комиссии для %s на %s"
+_CLOSE_POSITION_REPORT_FMT: Final = "Нет данных по закрытой позиции для %s на %s"
+
+
+# Общий неизменяемый пустой набор параметров: без аллокаций на частом пути «без параметров»
+_EMPTY_PARAMS: Final[Mapping[str, Any]] = MappingProxyType({})
+
+
+class ErrorCode(StrEnum):
+    """Коды ошибок инфраструктурного уровня SDK.
+
+    Члены являются строками: сравниваются, логируются и сериализуются без ``.value``.
+    """
 
     UNKNOWN = "unknown"
     TIMEOUT = "timeout"
@@ -35,7 +59,7 @@ class ErrorCode(Enum):
     TRIGGER_ORDERS_UNAVAILABLE = "trigger_orders_unavailable"
     ORDER_UNAVAILABLE = "order_unavailable"
     BALANCE_UNAVAILABLE = "balance_unavailable"
-    FEE_UNAVAILABLE = "fee_unavailable",
+    FEE_UNAVAILABLE = "fee_unavailable"
     CLOSE_POSITION_REPORT_UNAVAILABLE = "close_position_report_unavailable"
 
 
@@ -49,8 +73,12 @@ class SdkError(Exception):
         Машиночитаемый код класса ошибки для унификации обработки.
     retryable: bool
         Признак возможности безопасного повтора операции.
+    needs_context: bool
+        Атрибут класса: маппер ошибок заполняет контекст вызова (exchange/symbol/method).
     """
 
+    needs_context: ClassVar[bool] = False
+
     error_code: ErrorCode = ErrorCode.UNKNOWN
     retryable: bool = False
 
@@ -63,6 +91,8 @@ class ExchangeClientError(SdkError):
     Значения полей могут быть не заданы, если контекст недоступен.
     """
 
+    needs_context: ClassVar[bool] = True
+
     exchange: str | None = None
     symbol: str | None = None
     method: str | None = None
@@ -82,11 +112,7 @@ class PermanentExchangeError(ExchangeClientError):
 
 @dataclass(slots=True)
 class UnknownExchangeError(ExchangeClientError):
-    """Неопознанная ошибка внешней библиотеки/сети."""
-
-    def __post_init__(self) -> None:
-        """Установить код ошибки по умолчанию для неизвестной ошибки."""
-        self.error_code = ErrorCode.UNKNOWN
+    """Неопознанная ошибка внешней библиотеки/сети (код ``ErrorCode.UNKNOWN`` по умолчанию)."""
 
 
 @dataclass(slots=True)
@@ -103,78 +129,66 @@ class RateLimiterNotConfiguredError(RateLimiterError):
 class TickerUnavailableError(ExchangeClientError):
     """Текущий тикер не получен или неполон для указанного символа."""
 
-    def __post_init__(self) -> None:
-        """Установить код ошибки для отсутствующего тикера."""
-        self.error_code = ErrorCode.TICKER_UNAVAILABLE
+    error_code: ErrorCode = field(default=ErrorCode.TICKER_UNAVAILABLE, kw_only=True)
 
     def __str__(self) -> str:
         """Вернуть человекочитаемое представление ошибки."""
-        return f"Не удалось получить тикер для символа {self.symbol}, биржа {self.exchange}"
+        return _TICKER_FMT % (self.symbol, self.exchange)
 
 
 @dataclass(slots=True)
 class FundingRateUnavailableError(RetryableExchangeError):
     """Отсутствуют корректные данные о ставке финансирования по инструменту."""
 
-    def __post_init__(self) -> None:
-        """Установить код ошибки для отсутствующей ставки финансирования."""
-        self.error_code = ErrorCode.FUNDING_RATE_UNAVAILABLE
+    error_code: ErrorCode = field(default=ErrorCode.FUNDING_RATE_UNAVAILABLE, kw_only=True)
 
     def __str__(self) -> str:
         """Вернуть человекочитаемое представление ошибки."""
-        return f"Нет ставки funding для {self.symbol} на {self.exchange}"
+        return _FUNDING_RATE_FMT % (self.symbol, self.exchange)
 
 
 @dataclass(slots=True)
 class PositionUnavailableError(RetryableExchangeError):
     """Отсутствуют корректные данные о позиции по инструменту."""
 
-    def __post_init__(self) -> None:
-        """Установить код ошибки для отсутствующей позиции."""
-        self.error_code = ErrorCode.POSITION_UNAVAILABLE
+    error_code: ErrorCode = field(default=ErrorCode.POSITION_UNAVAILABLE, kw_only=True)
 
     def __str__(self) -> str:
         """Вернуть человекочитаемое представление ошибки."""
-        return f"Нет позиции для {self.symbol} на {self.exchange}"
+        return _POSITION_FMT % (self.symbol, self.exchange)
 
 
 @dataclass(slots=True)
 class InstrumentUnavailableError(RetryableExchangeError):
     """Отсутствуют корректные данные о инструменте."""
 
-    def __post_init__(self) -> None:
-        """Установить код ошибки для отсутствующего инструмента."""
-        self.error_code = ErrorCode.INSTRUMENT_UNAVAILABLE
+    error_code: ErrorCode = field(default=ErrorCode.INSTRUMENT_UNAVAILABLE, kw_only=True)
 
     def __str__(self) -> str:
         """Вернуть человекочитаемое представление ошибки."""
-        return f"Нет инструмента для {self.symbol} на {self.exchange}"
+        return _INSTRUMENT_FMT % (self.symbol, self.exchange)
 
 
 @dataclass(slots=True)
 class TriggerOrdersUnavailableError(RetryableExchangeError):
     """Отсутствуют корректные данные о триггер‑ордерах по инструменту."""
 
-    def __post_init__(self) -> None:
-        """Установить код ошибки для отсутствующих триггер‑ордеров."""
-        self.error_code = ErrorCode.TRIGGER_ORDERS_UNAVAILABLE
+    error_code: ErrorCode = field(default=ErrorCode.TRIGGER_ORDERS_UNAVAILABLE, kw_only=True)
 
     def __str__(self) -> str:
         """Вернуть человекочитаемое представление ошибки."""
-        return f"Нет данных по триггер‑ордерам для {self.symbol} на {self.exchange}"
+        return _TRIGGER_ORDERS_FMT % (self.symbol, self.exchange)
 
 
 @dataclass(slots=True)
 class BalanceUnavailableError(RetryableExchangeError):
     """Отсутствуют корректные данные о балансе по монете."""
 
-    def __post_init__(self) -> None:
-        """Установить код ошибки для отсутствующего баланса."""
-        self.error_code = ErrorCode.BALANCE_UNAVAILABLE
+    error_code: ErrorCode = field(default=ErrorCode.BALANCE_UNAVAILABLE, kw_only=True)
 
     def __str__(self) -> str:
         """Вернуть человекочитаемое представление ошибки."""
-        return f"Нет баланса для {self.symbol} на {self.exchange}"
+        return _BALANCE_FMT % (self.symbol, self.exchange)
 
 
 @dataclass(slots=True)
@@ -183,62 +197,56 @@ class UnsupportedFeatureError(SdkError):
 
     cex_id: str
     method: str
-    params: Mapping[str, Any]
+    params: Mapping[str, Any] = _EMPTY_PARAMS
+    error_code: ErrorCode = field(default=ErrorCode.UNSUPPORTED_FEATURE, kw_only=True)
 
     def __post_init__(self) -> None:
-        """Зафиксировать параметры и установить код ошибки."""
+        """Зафиксировать параметры."""
         # Защитная копия и запрет мутаций переданных параметров
-        self.params = MappingProxyType(dict(self.params))
-        self.error_code = ErrorCode.UNSUPPORTED_FEATURE
+        params = self.params
+        if params is not _EMPTY_PARAMS:
+            self.params = MappingProxyType(dict(params)) if params else _EMPTY_PARAMS
 
     def __str__(self) -> str:
         """Вернуть человекочитаемое представление ошибки."""
-        return f"Функция {self.method} не поддерживается биржей {self.cex_id} для параметров {self.params}"
+        return _UNSUPPORTED_FEATURE_FMT % (self.method, self.cex_id, self.params)
 
 
 @dataclass(slots=True)
 class OrderUnavailableError(ExchangeClientError):
     """Отсутствуют корректные данные о созданном ордере."""
 
-    def __post_init__(self) -> None:
-        """Установить код ошибки для отсутствующих данных ордера."""
-        self.error_code = ErrorCode.ORDER_UNAVAILABLE
+    error_code: ErrorCode = field(default=ErrorCode.ORDER_UNAVAILABLE, kw_only=True)
 
     def __str__(self) -> str:
         """Вернуть человекочитаемое представление ошибки."""
-        return f"Нет данных по ордеру для {self.symbol} на {self.exchange}"
+        return _ORDER_FMT % (self.symbol, self.exchange)
 
 
 @dataclass(slots=True)
 class FeeUnavailableError(RetryableExchangeError):
     """Отсутствуют корректные данные о комиссии."""
 
-    def __post_init__(self) -> None:
-        """Установить код ошибки для отсутствующей комиссии."""
-        self.error_code = ErrorCode.FEE_UNAVAILABLE
+    error_code: ErrorCode = field(default=ErrorCode.FEE_UNAVAILABLE, kw_only=True)
 
     def __str__(self) -> str:
         """Вернуть человекочитаемое представление ошибки."""
-        return f"Нет данных по комиссии для {self.symbol} на {self.exchange}"
+        return _FEE_FMT % (self.symbol, self.exchange)
 
 
 @dataclass(slots=True)
 class ClosePositionReportUnavailableError(RetryableExchangeError):
     """Отсутствуют корректные данные о закрытой позиции."""
 
-    def __post_init__(self) -> None:
-        """Установить код ошибки для отсутствующей закрытой позиции."""
-        self.error_code = ErrorCode.CLOSE_POSITION_REPORT_UNAVAILABLE
+    error_code: ErrorCode = field(default=ErrorCode.CLOSE_POSITION_REPORT_UNAVAILABLE, kw_only=True)
 
     def __str__(self) -> str:
         """Вернуть человекочитаемое представление ошибки."""
-        return f"Нет данных по закрытой позиции для {self.symbol} на {self.exchange}"
+        return _CLOSE_POSITION_REPORT_FMT % (self.symbol, self.exchange)
 
 
 @dataclass(slots=True)
 class AlreadyConfiguredError(PermanentExchangeError):
     """Сообщает, что запрошенный режим уже установлен."""
 
-    def __post_init__(self) -> None:
-        """Установить код ошибки EXCHANGE_ERROR."""
-        self.error_code = ErrorCode.EXCHANGE_ERROR
+    error_code: ErrorCode = field(default=ErrorCode.EXCHANGE_ERROR, kw_only=True)
@@ -7,9 +7,10 @@
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable, Sequence
-from dataclasses import dataclass
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass, field
 from decimal import Decimal
+from types import MappingProxyType
 from typing import Any, Concatenate, ParamSpec, TypeVar
 
 from fundingbot_sdk.contracts.ports.rate_limiter import RateLimiterPort, RateLimitPermitProtocol
@@ -24,12 +25,16 @@ from fundingbot_sdk.contracts.protocols import (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CexClientConfig:
     """Конфигурация клиента централизованной биржи (CEX).
 
     Содержит ключи API, параметры тестовой среды и дополнительные опции,
     такие как режим по умолчанию и внешний rate‑лимитер.
+
+    Конфигурация неизменяема и хешируема (``options`` в хеше не участвуют);
+    для производной конфигурации используйте ``dataclasses.replace``, например
+    ``replace(config, options={**config.options, "key": value})``.
     """
 
     api_key: str | None = None
@@ -39,7 +44,7 @@ class CexClientConfig:
     uid: str | None = None
     default_type: str = "swap"
     rate_limiter: RateLimiterPort | None = None
-    options: dict[str, Any] | None = None
+    options: Mapping[str, Any] = field(default=MappingProxyType({}), hash=False)
 
 
 P = ParamSpec("P")
@@ -1,10 +1,27 @@
 from abc import ABC, abstractmethod
-from contextlib import AbstractAsyncContextManager
+from types import TracebackType
 from typing import Protocol
 
 
-class RateLimitPermitProtocol(AbstractAsyncContextManager[None], Protocol):
-    """Контекст, который освободит квоту при выходе."""
+class RateLimitPermitProtocol(Protocol):
+    """Контекст, который освободит квоту при выходе.
+
+    Структурный протокол асинхронного контекст-менеджера без базы
+    ``AbstractAsyncContextManager``: реализациям не нужен ABCMeta в иерархии.
+    """
+
+    async def __aenter__(self) -> None:
+        """Войти в контекст разрешения."""
+        ...
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool | None:
+        """Освободить квоту при выходе из контекста."""
+        ...
 
 
 class RateLimiterPort(ABC):
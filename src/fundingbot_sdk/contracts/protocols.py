@@ -3,16 +3,26 @@
 Определяют минимально необходимый набор свойств для балансов, позиций, ордеров,
 инструментов, тикеров и ставок funding. Используются адаптерами и приложением
 для статической типизации и контрактного программирования.
+
+Члены объявлены как read-only ``@property``: такому контракту удовлетворяют
+неизменяемые (``frozen``) датаклассы, тогда как голые аннотации атрибутов
+тайп-чекеры трактуют как изменяемые. В рантайме протоколы не участвуют, поэтому
+реализациям стоит хранить значения в обычных полях slotted-датаклассов, а не
+в ``@property``: чтение слота дешевле вызова свойства.
 """
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Protocol, runtime_checkable
+from typing import Protocol
 
 
-@runtime_checkable
 class BalanceProtocol(Protocol):
-    """Снимок баланса по монете на бирже."""
+    """Снимок баланса по монете на бирже.
+
+    Протокол не ``runtime_checkable``: ``isinstance`` по нему перебирает все члены
+    через ``hasattr``. Для проверки в рантайме используйте конкретный класс
+    ``fundingbot_sdk.schemas.balance.BalanceResponse``.
+    """
 
     @property
     def free(self) -> Decimal:
@@ -260,3 +270,22 @@ class TickerProtocol(Protocol):
     def last_price(self) -> Decimal:
         """Последняя цена сделки (last)."""
         ...
+
+
+class TickerFloatProtocol(Protocol):
+    """Облегчённый снимок тикера с ценой во ``float`` для массовых сканов рынка.
+
+    Не предназначен для расчёта параметров ордеров: там используется ``TickerProtocol``
+    с ``Decimal`` и округление через ``price_to_precision``; цену скана перед этим
+    приводят к ``Decimal`` через ``fundingbot_sdk.schemas.base.to_decimal``.
+    """
+
+    @property
+    def symbol(self) -> str:
+        """Символ инструмента тикера."""
+        ...
+
+    @property
+    def last_price(self) -> float:
+        """Последняя цена сделки (last)."""
+        ...
@@ -1,15 +1,38 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
 from decimal import Decimal
+from typing import Any, ClassVar, Self
 
-from pydantic import Field
-from pydantic.dataclasses import dataclass as pdc_dataclass
+from fundingbot_sdk.schemas.base import to_decimal
 
-from fundingbot_sdk.schemas.base import ResponseBase
 
-
-@pdc_dataclass(frozen=True, slots=True)
-class BalanceResponse(ResponseBase):
+@dataclass(slots=True, frozen=True)
+class BalanceResponse:
     """Датакласс баланса монеты на бирже."""
 
-    free: Decimal = Field(..., description="Free balance", validation_alias="free")
-    used: Decimal = Field(..., description="Used balance", validation_alias="used")
-    total: Decimal = Field(..., description="Total balance", validation_alias="total")
+    free: Decimal  # свободный баланс
+    used: Decimal  # зарезервированный баланс
+    total: Decimal  # суммарный баланс
+
+    ZERO: ClassVar["BalanceResponse"]  # нулевой баланс (общий экземпляр, объект неизменяем)
+
+    @classmethod
+    def from_raw(cls, data: Mapping[str, Any]) -> Self:
+        """Собрать DTO из сырого словаря источника с ключами ``free``/``used``/``total``.
+
+        Raises:
+            ValueError: Поля отсутствуют или не приводятся к ``Decimal``.
+
+        """
+        try:
+            return cls(
+                free=to_decimal(data["free"]),
+                used=to_decimal(data["used"]),
+                total=to_decimal(data["total"]),
+            )
+        except (KeyError, TypeError, ValueError, ArithmeticError) as e:
+            msg = f"Некорректные данные баланса raw:{data}"
+            raise ValueError(msg) from e
+
+
+BalanceResponse.ZERO = BalanceResponse(free=Decimal(0), used=Decimal(0), total=Decimal(0))
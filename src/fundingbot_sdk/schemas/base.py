@@ -1,36 +1,26 @@
 from abc import ABC
+from datetime import UTC, datetime
 from decimal import Decimal
-from typing import Any
+from typing import cast
 
-from pydantic import BaseModel, ConfigDict, field_serializer
+from pydantic import BaseModel, ConfigDict
 from pydantic.dataclasses import dataclass as pdc_dataclass
 
 
 class BaseSchema(BaseModel):
-    """Базовая схема с общими настройками Pydantic v2."""
+    """Базовая схема с общими настройками Pydantic v2.
+
+    ``Decimal`` выгружается в JSON строкой (``str(v)``) штатным сериализатором
+    pydantic-core, без Python-колбэка на каждое поле.
+    """
 
     model_config = ConfigDict(
+        extra="ignore",                # лишние ключи источника отбрасываются, как и в ResponseBase
         populate_by_name=True,         # разрешить заполнять поля как по alias, так и по их именам
         arbitrary_types_allowed=True,  # разрешить произвольные типы (Decimal и т.п.)
         frozen=True,                   # сделать экземпляры неизменяемыми (заменяет allow_mutation=False)
     )
 
-    # универсальный сериализатор
-    @field_serializer("*", when_used="json")
-    def _serialize_decimal(self, v: Any) -> Any:  # noqa: ANN401, PLR6301
-        """Преобразует Decimal ➜ str при выгрузке в JSON.
-
-        Декоратор с mask '*' применяется ко всем полям; для любых других типов
-        значение возвращается как есть.
-
-        Returns:
-            Any: Строка, если ``v`` является ``Decimal``, иначе исходное значение.
-
-        """
-        if isinstance(v, Decimal):
-            return str(v)
-        return v
-
 
 @pdc_dataclass(
     config=ConfigDict(
@@ -41,8 +31,48 @@ class BaseSchema(BaseModel):
     frozen=True
 )
 class ResponseBase(ABC):
-    @field_serializer("*", when_used="json")
-    def _serialize_decimal(self, v: Any) -> Any:  # noqa: ANN401, PLR6301
-        if isinstance(v, Decimal):
-            return str(v)
-        return v
+    """Базовый pydantic-датакласс ответов; ``Decimal`` выгружается в JSON строкой штатно."""
+
+
+def to_decimal(v: object) -> Decimal:
+    """Привести значение источника (str/int/float/Decimal) к ``Decimal``.
+
+    ``float`` проходит через ``str``, чтобы в ``Decimal`` не попадал двоичный хвост.
+    Готовый ``Decimal`` (неизменяемый) возвращается как есть, без обхода через строку.
+
+    Raises:
+        ValueError: Значение не является конечным числом (NaN, Infinity), как и в
+            валидации ``Decimal``-полей pydantic.
+
+    """
+    d = cast("Decimal", v) if type(v) is Decimal else Decimal(str(v))
+    if not d.is_finite():
+        msg = f"Ожидалось конечное число, получено {v!r}"
+        raise ValueError(msg)
+    return d
+
+
+_from_timestamp = datetime.fromtimestamp
+_from_isoformat = datetime.fromisoformat
+
+
+def to_datetime(v: object) -> datetime:
+    """Преобразует ISO или миллисекунды Unix к UTC‑aware datetime.
+
+    От адаптеров почти всегда приходит ``int`` (мс), поэтому точные типы проверяются
+    через ``type(v) is ...`` до общих ``isinstance``.
+    """
+    t = type(v)
+    if t is int:
+        return _from_timestamp(cast("int", v) / 1000, tz=UTC)
+    if t is datetime:
+        return cast("datetime", v)
+    if t is not str:
+        if t is float:
+            return _from_timestamp(int(cast("float", v)) / 1000, tz=UTC)
+        if isinstance(v, datetime):
+            return v
+        if isinstance(v, (int, float)):
+            return _from_timestamp(int(v) / 1000, tz=UTC)
+    # строка: fromisoformat (Python 3.12+) сам принимает суффикс Z
+    return _from_isoformat(cast("str", v) if t is str else str(v))
@@ -1,79 +1,99 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, cast
+from typing import Any, Self
 
-from pydantic import Field
-from pydantic.dataclasses import dataclass as pdc_dataclass
+from fundingbot_sdk.schemas.base import to_datetime, to_decimal
 
-from fundingbot_sdk.schemas.base import ResponseBase
 
-
-@pdc_dataclass(slots=True, frozen=True)
-class Fee(ResponseBase):
+@dataclass(slots=True, frozen=True)
+class Fee:
     """Элемент детализации комиссий за сделки."""
 
-    type: str = Field(..., description="Тип комиссии: maker/taker/other", validation_alias="type")
-    currency: str = Field(..., description="Валюта комиссии", validation_alias="currency")
-    cost: Decimal = Field(..., description="Сумма комиссии (отрицательное значение - списание)", validation_alias="cost")
-    info: dict[str, Any] = Field(default_factory=dict, description="Сырые данные источника", validation_alias="info")
+    type: str  # тип комиссии: maker/taker/other
+    currency: str  # валюта комиссии
+    cost: Decimal  # сумма комиссии (отрицательное значение - списание)
+    info: dict[str, Any] = field(default_factory=dict)  # сырые данные источника
+
+    @classmethod
+    def from_raw(cls, data: Mapping[str, Any]) -> Self:
+        """Собрать DTO из сырого словаря источника.
+
+        Raises:
+            ValueError: Обязательные поля отсутствуют или не приводятся к нужным типам.
+
+        """
+        try:
+            return cls(
+                type=data["type"],
+                currency=data["currency"],
+                cost=to_decimal(data["cost"]),
+                info=dict(data.get("info") or {}),
+            )
+        except (KeyError, TypeError, ValueError, ArithmeticError) as e:
+            msg = f"Некорректные данные комиссии raw:{data}"
+            raise ValueError(msg) from e
 
 
-@pdc_dataclass(slots=True, frozen=True)
-class ClosePositionReportResponse(ResponseBase):
+@dataclass(slots=True, frozen=True)
+class ClosePositionReportResponse:
     """Отчёт о закрытой позиции на бирже.
 
     Содержит агрегированные сведения об исполнениях открытия/закрытия, начисленном funding,
     комиссиях и дополнительной мета‑информации.
     """
 
-    exchange: str = Field(..., description="Биржа", validation_alias="exchange")
-    symbol: str = Field(..., description="Символ CCXT, например BTC/USDT:USDT", validation_alias="symbol")
-    side: str = Field(..., description="buy/sell", validation_alias="side")
-    contracts: Decimal = Field(..., description="Количество контрактов", validation_alias="contracts")
-    opened_at: datetime = Field(
-        ...,
-        description="Фактическое время открытия (по исполнению)",
-        validation_alias="opened_at"
-    )
-    closed_at: datetime = Field(
-        ...,
-        description="Фактическое время закрытия (по исполнению)",
-        validation_alias="closed_at"
-    )
-    entry_price_avg: Decimal = Field(
-        ..., description="Средняя цена входа по исполнениям", validation_alias="entry_price_avg"
-    )
-    exit_price_avg: Decimal = Field(
-        ..., description="Средняя цена выхода по исполнениям", validation_alias="exit_price_avg"
-    )
-    leverage: Decimal = Field(
-        ..., description="Плечо позиции на момент открытия/ведения", validation_alias="leverage"
-    )
-    funding_income: Decimal = Field(
-        ...,
-        description="Начисление/списание funding за период позиции",
-        validation_alias="funding_income",
-    )
-    funding_income_percent: Decimal | None = Field(
-        default=None,
-        description="Funding в процентах от нотионала позиции (contracts x avg price)",
-        validation_alias="funding_income_percent",
-    )
-    fees_total_percent: Decimal | None = Field(
-        default=None,
-        description="Комиссии в процентах от нотионала позиции (contracts x avg price)",
-        validation_alias="fees_total_percent",
-    )
-    fees_total: Decimal = Field(
-        default=Decimal(0), description="Сумма всех комиссий (в валюте расчёта)",
-        validation_alias="fees_total"
-    )
-    fees: list[Fee] = Field(
-        default_factory=lambda: cast("list[Fee]", []),
-        description="Детализация комиссий",
-        validation_alias="fees",
-    )
-    extra: dict[str, Any] = Field(
-        default_factory=dict, description="Произвольные дополнительные поля",
-        validation_alias="extra"
-    )
+    exchange: str  # биржа
+    symbol: str  # символ CCXT, например BTC/USDT:USDT
+    side: str  # buy/sell
+    contracts: Decimal  # количество контрактов
+    opened_at: datetime  # фактическое время открытия (по исполнению)
+    closed_at: datetime  # фактическое время закрытия (по исполнению)
+    entry_price_avg: Decimal  # средняя цена входа по исполнениям
+    exit_price_avg: Decimal  # средняя цена выхода по исполнениям
+    leverage: Decimal  # плечо позиции на момент открытия/ведения
+    funding_income: Decimal  # начисление/списание funding за период позиции
+    # funding и комиссии в процентах от нотионала позиции (contracts x avg price)
+    funding_income_percent: Decimal | None = None
+    fees_total_percent: Decimal | None = None
+    fees_total: Decimal = Decimal(0)  # сумма всех комиссий (в валюте расчёта)
+    fees: list[Fee] = field(default_factory=list)  # детализация комиссий
+    extra: dict[str, Any] = field(default_factory=dict)  # произвольные дополнительные поля
+
+    @classmethod
+    def from_raw(cls, data: Mapping[str, Any]) -> Self:
+        """Собрать отчёт из сырого словаря; ключи совпадают с именами полей.
+
+        Элементы ``fees`` принимаются как готовые ``Fee`` или как словари источника.
+
+        Raises:
+            ValueError: Обязательные поля отсутствуют или не приводятся к нужным типам.
+
+        """
+        funding_income_percent = data.get("funding_income_percent")
+        fees_total_percent = data.get("fees_total_percent")
+        fees_total = data.get("fees_total")
+        try:
+            return cls(
+                exchange=data["exchange"],
+                symbol=data["symbol"],
+                side=data["side"],
+                contracts=to_decimal(data["contracts"]),
+                opened_at=to_datetime(data["opened_at"]),
+                closed_at=to_datetime(data["closed_at"]),
+                entry_price_avg=to_decimal(data["entry_price_avg"]),
+                exit_price_avg=to_decimal(data["exit_price_avg"]),
+                leverage=to_decimal(data["leverage"]),
+                funding_income=to_decimal(data["funding_income"]),
+                funding_income_percent=(
+                    None if funding_income_percent is None else to_decimal(funding_income_percent)
+                ),
+                fees_total_percent=None if fees_total_percent is None else to_decimal(fees_total_percent),
+                fees_total=Decimal(0) if fees_total is None else to_decimal(fees_total),
+                fees=[f if isinstance(f, Fee) else Fee.from_raw(f) for f in data.get("fees") or ()],
+                extra=dict(data.get("extra") or {}),
+            )
+        except (KeyError, TypeError, ValueError, ArithmeticError) as e:
+            msg = f"Некорректные данные отчёта о закрытой позиции raw:{data}"
+            raise ValueError(msg) from e
@@ -1,73 +1,98 @@
-from collections.abc import Hashable
-from datetime import UTC, datetime
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import datetime
 from decimal import Decimal
-from typing import TypeGuard
+from typing import Any, Self
 
-from pydantic import Field, field_validator, model_validator
-from pydantic.dataclasses import dataclass as pdc_dataclass
+from fundingbot_sdk.schemas.base import to_datetime, to_decimal
 
-from fundingbot_sdk.schemas.base import ResponseBase
 
+@lru_cache(maxsize=4096)
+def _canonical_symbol(raw: str) -> str:
+    """Привести символ к виду BASE/USDT:USDT и интернировать результат.
 
-@pdc_dataclass(slots=True, frozen=True)
-class FundingRateResponse(ResponseBase):
-    """Нормализует данные о ставке финансирования инструмента."""
+    Вселенная символов биржи невелика и опрашивается повторно, поэтому нормализация
+    кешируется: повторный вызов сводится к поиску в словаре.
+    """
+    if raw.find(":") != -1:
+        return sys.intern(raw if raw.endswith(":USDT") else f"{raw}:USDT")
+    if raw.endswith("/USDT"):
+        return sys.intern(f"{raw}:USDT")
+    if raw.endswith("USDT"):
+        return sys.intern(f"{raw[:-4]}/USDT:USDT")
+    return sys.intern(raw)
 
-    symbol: str = Field(..., validation_alias="symbol", description="Торговый инструмент")
-    exchange: str = Field(..., validation_alias="exchange", description="Биржа")
 
-    funding_rate: Decimal = Field(
-        ...,
-        validation_alias="fundingRate",
-        description="Ставка финансирования (доля)"
-    )
-    funding_date: datetime = Field(
-        ...,
-        validation_alias="fundingTimestamp",
-        description="Дата и время выплаты финансирования (ISO)"
-    )
+@dataclass(slots=True, frozen=True)
+class FundingRateResponse:
+    """Нормализует данные о ставке финансирования инструмента.
 
-    @staticmethod
-    def _is_dict(x: object) -> TypeGuard[dict[Hashable, object]]:
-        return isinstance(x, dict)
+    Обычный slotted‑датакласс без Pydantic: экземпляры создаются на горячем пути
+    загрузки ставок, поэтому нормализация сырых данных вынесена в ``from_raw``.
+    """
+
+    symbol: str  # торговый инструмент
+    exchange: str  # биржа
+    funding_rate: Decimal  # ставка финансирования (доля)
+    funding_date: datetime  # дата и время выплаты финансирования (UTC)
 
-    @model_validator(mode="before")
     @classmethod
-    def _normalize_input(cls, data: object) -> object:
-        if not cls._is_dict(data):
-            return data
+    def from_raw(cls, data: Mapping[str, Any]) -> Self:
+        """Собрать DTO из сырого словаря источника.
+
+        Ожидаются ключи ccxt: ``symbol``, ``exchange``, ``fundingRate`` и
+        ``fundingTimestamp`` (или ``nextFundingTimestamp`` при его отсутствии).
 
-        d = dict(data)
+        Raises:
+            ValueError: Обязательные поля отсутствуют или не приводятся к нужным типам.
 
-        ts = d.get("fundingTimestamp")
+        """
+        try:
+            symbol = data["symbol"]
+            exchange = data["exchange"]
+        except KeyError as e:
+            msg = f"Некорректные данные ставки финансирования raw:{data}"
+            raise ValueError(msg) from e
+        return cls.from_ccxt(data, symbol=symbol, exchange=exchange)
+
+    @classmethod
+    def from_ccxt(cls, raw: Mapping[str, Any], *, symbol: str, exchange: str) -> Self:
+        """Собрать DTO из структуры funding rate ccxt без промежуточного словаря.
+
+        Читает фиксированный набор ключей ccxt (``fundingRate``, ``fundingTimestamp``/
+        ``nextFundingTimestamp``); символ и биржа передаются отдельно, т.к. ccxt
+        не кладёт биржу в структуру, а символ служит ключом ответа ``fetch_funding_rates``.
+
+        Raises:
+            ValueError: Обязательные поля отсутствуют или не приводятся к нужным типам.
+
+        """
+        ts = raw.get("fundingTimestamp")
         if ts is None:
-            ts = d.get("nextFundingTimestamp")
+            ts = raw.get("nextFundingTimestamp")
 
         if ts is None:
-            msg = f"Отсутствует значение даты финансирования [nextFundingTimestamp, fundingTimestamp] raw:{data}"
+            msg = f"Отсутствует значение даты финансирования [nextFundingTimestamp, fundingTimestamp] raw:{raw}"
             raise ValueError(msg)
 
-        d["fundingTimestamp"] = ts
-        return d
+        try:
+            return cls(
+                symbol=cls.normalize_symbol(symbol),
+                exchange=exchange,
+                funding_rate=to_decimal(raw["fundingRate"]),
+                funding_date=to_datetime(ts),
+            )
+        except (KeyError, TypeError, ValueError, ArithmeticError) as e:
+            msg = f"Некорректные данные ставки финансирования raw:{raw}"
+            raise ValueError(msg) from e
 
-    @field_validator("symbol", mode="before")
-    def _normalize_symbol(cls, v: str) -> str:
+    @staticmethod
+    def normalize_symbol(v: object) -> str:
         """Приводит символ к виду BASE/USDT:USDT."""
-        raw = str(v)
-        if ":" in raw:
-            return raw if raw.endswith(":USDT") else f"{raw}:USDT"
-        if raw.endswith("USDT"):
-            base = raw[:-4]
-            return f"{base}/USDT:USDT"
-        return raw
-
-    @field_validator("funding_date", mode="before")
-    def _to_datetime(cls, v: datetime | str | int) -> datetime:
-        """Преобразует ISO или миллисекунды Unix к UTC‑aware datetime."""
-        if isinstance(v, datetime):
-            return v
-        if isinstance(v, (int, float)):
-            return datetime.fromtimestamp(int(v) / 1000, tz=UTC)
-        # строка: допускаем суффикс Z
-        iso = str(v).replace("Z", "+00:00")
-        return datetime.fromisoformat(iso)
+        s = v if type(v) is str else str(v)
+        if s.endswith(":USDT"):
+            # уже канонический вид (основной случай для ccxt): без обращения к кешу
+            return s
+        return _canonical_symbol(s)
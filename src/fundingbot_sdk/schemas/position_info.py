@@ -1,11 +1,16 @@
-from datetime import UTC, datetime as dt
+from datetime import datetime as dt
 from decimal import Decimal
-from typing import Any, cast
+from typing import Any, Final, cast
 
 from pydantic import Field, field_validator, model_validator
 from pydantic.dataclasses import dataclass as pdc_dataclass
 
-from fundingbot_sdk.schemas.base import ResponseBase
+from fundingbot_sdk.schemas.base import ResponseBase, to_datetime
+
+# Ключи времени обновления позиции в info у разных бирж, в порядке приоритета
+_UPDATE_TIME_KEYS: Final = ("updateTime", "updatedTime", "uTime")
+# Неизменяемый ноль: не создаётся заново при каждой нормализации contracts
+_ZERO: Final = Decimal(0)
 
 
 @pdc_dataclass(slots=True, frozen=True)
@@ -52,9 +57,9 @@ class CCXTPositionInfoResponse(PositionInfoResponse):
     def _contracts_none_or_empty_to_zero(cls, v: object) -> object:
         """Нормализует ``contracts``: ``None`` или пустая строка преобразуются в 0."""
         if v is None:
-            return Decimal(0)
+            return _ZERO
         if isinstance(v, str) and not v.strip():
-            return Decimal(0)
+            return _ZERO
         return v
 
     @model_validator(mode="before")
@@ -64,17 +69,23 @@ class CCXTPositionInfoResponse(PositionInfoResponse):
 
         Принимает словарь от ccxt: добавляет недостающие ``timestamp``/``datetime`` и
         приводит ``id`` к строке. Остальные поля валидируются базовым классом.
+        Исходный словарь не изменяется; без дозаполнения он передаётся дальше как есть.
         """
         if not isinstance(data, dict):
             return data
 
-        item: dict[str, Any] = dict(cast("dict[str, Any]", data))
+        item = cast("dict[str, Any]", data)
 
-        # Заполнить timestamp/datetime из info.updateTime, если оба отсутствуют
+        # Заполнить timestamp/datetime из info.updateTime, если оба отсутствуют;
+        # копия источника создаётся только здесь, когда в неё дописываются ключи
         if item.get("timestamp") is None and item.get("datetime") is None:
             info_raw = item.get("info")
             info: dict[str, Any] = cast("dict[str, Any]", info_raw) if isinstance(info_raw, dict) else {}
-            update_at: Any = info.get("updateTime") or info.get("updatedTime") or info.get("uTime")
+            update_at: Any = None
+            for key in _UPDATE_TIME_KEYS:
+                update_at = info.get(key)
+                if update_at:
+                    break
             update_at_int: int | None = None
             if isinstance(update_at, (int, float)):
                 update_at_int = int(update_at)
@@ -89,7 +100,8 @@ class CCXTPositionInfoResponse(PositionInfoResponse):
                     update_at_int = None
 
             if update_at_int is not None:
+                item = dict(item)
                 item["timestamp"] = update_at_int
-                item["datetime"] = dt.fromtimestamp(update_at_int / 1000, UTC)
+                item["datetime"] = to_datetime(update_at_int)
 
         return item
@@ -1,8 +1,10 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Any
+from typing import Any, Self
 
-from pydantic import Field
+from pydantic import Field, SkipValidation
 from pydantic.dataclasses import dataclass as pdc_dataclass
 
 from fundingbot_sdk.schemas.base import ResponseBase
@@ -19,5 +21,32 @@ class TickerResponse(ResponseBase):
     timestamp: int | None = Field(default=None, description="Метка времени (мс)", validation_alias="timestamp")
     datetime_iso: datetime | None = Field(default=None, description="Время ISO", validation_alias="datetime")
 
-    # оригинальный ответ поставщика
-    info: dict[str, Any] = Field(default_factory=dict, description="Сырые данные источника", validation_alias="info")
+    # оригинальный ответ поставщика: хранится по ссылке, без копирования и валидации
+    info: SkipValidation[dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Сырые данные источника",
+        validation_alias="info",
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class TickerFloatResponse:
+    """Облегчённый тикер для сканов рынка: цена во ``float``, без валидации Pydantic."""
+
+    symbol: str
+    last_price: float  # последняя цена сделки
+    timestamp: int | None = None  # метка времени (мс)
+
+    @classmethod
+    def from_raw(cls, data: Mapping[str, Any]) -> Self:
+        """Собрать DTO из тикера ccxt (ключи ``symbol``, ``last``, ``timestamp``).
+
+        Raises:
+            ValueError: Символ или последняя цена отсутствуют либо не приводятся к типам.
+
+        """
+        try:
+            return cls(symbol=data["symbol"], last_price=float(data["last"]), timestamp=data.get("timestamp"))
+        except (KeyError, TypeError) as e:
+            msg = f"Некорректные данные тикера raw:{data}"
+            raise ValueError(msg) from e
@@ -35,11 +35,12 @@ from fundingbot_sdk.contracts.errors import (
 from fundingbot_sdk.contracts.ports.cex_client import CexClientPort
 from fundingbot_sdk.contracts.protocols import TriggerOrderProtocol
 from fundingbot_sdk.schemas.balance import BalanceResponse
+from fundingbot_sdk.schemas.base import to_decimal
 from fundingbot_sdk.schemas.funding import FundingRateResponse
 from fundingbot_sdk.schemas.market import MarketResponse
 from fundingbot_sdk.schemas.order import CreateOrderResponse, TriggerOrderResponse
 from fundingbot_sdk.schemas.position_info import CCXTPositionInfoResponse
-from fundingbot_sdk.schemas.ticker import TickerResponse
+from fundingbot_sdk.schemas.ticker import TickerFloatResponse, TickerResponse
 from fundingbot_sdk.toolkit.error_mapper import map_sdk_errors
 
 if TYPE_CHECKING:
@@ -51,6 +52,7 @@ if TYPE_CHECKING:
         InstrumentProtocol,
         OrderEntityProtocol,
         PositionProtocol,
+        TickerFloatProtocol,
         TickerProtocol,
     )
 
@@ -60,6 +62,9 @@ logger = logging.getLogger(__name__)
 _current_weight: contextvars.ContextVar[int | None] = contextvars.ContextVar("_current_weight", default=None)
 _preacquired: contextvars.ContextVar[bool] = contextvars.ContextVar("_preacquired", default=False)
 
+# Линейный USDT‑символ: BASE/USDT или BASE/USDT:USDT
+_USDT_SYMBOL_RE = re.compile(r"\A\w+/USDT(?::USDT)?\Z")
+
 
 def rate_limited(weight: int = 1) -> Callable[[F], F]:
     """Сохраняет вес операции и передаёт его в ccxt.request().
@@ -120,12 +125,17 @@ class CcxtClient(CexClientPort):
     """
 
     _ticker_response_adapter = TypeAdapter(TickerResponse)
-    _position_info_adapter = TypeAdapter(CCXTPositionInfoResponse)
+    _position_info_list_adapter = TypeAdapter(list[CCXTPositionInfoResponse])
     _market_response_adapter = TypeAdapter(MarketResponse)
     _trigger_order_list_adapter = TypeAdapter(list[TriggerOrderResponse])
-    _funding_rate_response_adapter = TypeAdapter(FundingRateResponse)
     _create_order_response_adapter = TypeAdapter(CreateOrderResponse)
-    _balance_response_adapter = TypeAdapter(BalanceResponse)
+
+    # Валидаторы pydantic-core напрямую: без обёртки TypeAdapter.validate_python на вызов
+    _validate_ticker = _ticker_response_adapter.validator.validate_python
+    _validate_position_info_list = _position_info_list_adapter.validator.validate_python
+    _validate_market = _market_response_adapter.validator.validate_python
+    _validate_trigger_order_list = _trigger_order_list_adapter.validator.validate_python
+    _validate_create_order = _create_order_response_adapter.validator.validate_python
 
     def __init__(self, exchange_name: str, config: CexClientConfig, *, verbose: bool = False) -> None:
         """Инициализировать клиента ccxt.
@@ -143,6 +153,10 @@ class CcxtClient(CexClientPort):
         self._default_type = config.default_type
         self._exchange_name = exchange_name
         self._rate_limiter: RateLimiterPort | None = config.rate_limiter
+        # Производные от справочника рынков; пересчитываются, когда ccxt заменяет markets
+        self._markets_ref: object = None
+        self._type_symbols: tuple[str, ...] = ()
+        self._active_usdt_symbols: frozenset[str] = frozenset()
 
         exchange_class = getattr(ccxt, exchange_name)
         # ccxt не полностью типизирован; используем Any, чтобы не протекали Unknown-типы
@@ -162,16 +176,46 @@ class CcxtClient(CexClientPort):
     @final
     @override
     async def acquire_permit(self, op: Callable[..., Awaitable[Any]]) -> RateLimitPermitProtocol:
-        fn = op.__func__ if hasattr(op, "__func__") else op  # type: ignore[reportUnknownMemberType]
-        weight: int = getattr(fn, "__rl_weight__", 1)
-        if self._rate_limiter is None:
+        # Вес запечён в функцию декоратором @rate_limited; связанный метод отдаёт
+        # атрибуты своей функции, поэтому достаточно одного getattr.
+        limiter = self._rate_limiter
+        if limiter is None:
             raise RateLimiterNotConfiguredError
-        return await self._rate_limiter.acquire(weight)
+        weight: int = getattr(op, "__rl_weight__", 1)
+        return await limiter.acquire(weight)
 
     async def load_markets(self, *, reload: bool = False, params: dict[str, Any] | None = None) -> None:
         """Загрузить справочник рынков ccxt, при необходимости обновив кэш."""
         await self._exchange.load_markets(reload=reload, params=params or {})
 
+    async def _ensure_markets(self) -> None:
+        """Загрузить справочник рынков, только если ccxt его ещё не заполнил."""
+        if not self._exchange.markets:
+            await self.load_markets()
+
+    def _refresh_market_index(self) -> None:
+        """Пересчитать списки символов, если ccxt подменил словарь ``markets``.
+
+        ccxt создаёт новый словарь при (пере)загрузке рынков, поэтому сравнения
+        ссылки достаточно, чтобы не обходить все рынки на каждом вызове.
+        """
+        markets = self._exchange.markets
+        if markets is self._markets_ref:
+            return
+        default_type = self._default_type
+        type_symbols: list[str] = []
+        active_usdt: set[str] = set()
+        # Один проход по рынкам без генераторов: символ читается один раз
+        for m in markets.values():
+            symbol = m["symbol"]
+            if m.get("type") == default_type:
+                type_symbols.append(symbol)
+            if m.get("swap") is True and m.get("active") is True and symbol.endswith(":USDT"):
+                active_usdt.add(symbol)
+        self._type_symbols = tuple(type_symbols)
+        self._active_usdt_symbols = frozenset(active_usdt)
+        self._markets_ref = markets
+
     @property
     def cex_id(self) -> str:
         """Вернуть идентификатор (имя) биржи, используемый в ccxt."""
@@ -180,19 +224,33 @@ class CcxtClient(CexClientPort):
     @override
     @map_sdk_errors
     async def get_market_symbols(self) -> list[str]:
-        await self.load_markets()
-        return [m["symbol"] for m in self._exchange.markets.values() if m.get("type") == self._default_type]
+        await self._ensure_markets()
+        self._refresh_market_index()
+        return list(self._type_symbols)
 
     @override
     @map_sdk_errors
     async def get_ticker(self, symbol: str) -> TickerProtocol:
         data = await self._exchange.fetch_ticker(symbol)
         try:
-            dto = self._ticker_response_adapter.validate_python(data)
+            dto = self._validate_ticker(data)
         except ValidationError as e:
             raise TickerUnavailableError(symbol=symbol, exchange=self.cex_id) from e
         return dto
 
+    @map_sdk_errors
+    async def get_ticker_float(self, symbol: str) -> TickerFloatProtocol:
+        """Получить тикер ``symbol`` с ценой во ``float`` (для массовых сканов рынка).
+
+        В отличие от ``get_ticker`` не строит ``Decimal`` и не валидирует ответ Pydantic;
+        для расчёта ордеров используйте ``get_ticker`` и ``price_to_precision``.
+        """
+        data = await self._exchange.fetch_ticker(symbol)
+        try:
+            return TickerFloatResponse.from_raw(data)
+        except ValueError as e:
+            raise TickerUnavailableError(symbol=symbol, exchange=self.cex_id) from e
+
     @override
     @map_sdk_errors
     async def get_positions(
@@ -202,36 +260,35 @@ class CcxtClient(CexClientPort):
     ) ->  Sequence[PositionProtocol]:
         data = await self._exchange.fetch_positions(symbols=symbols, params=params or {})
 
-        filtered: list[CCXTPositionInfoResponse] = []
-        for item in data:
-            if item.get("contracts") == 0 or item.get("side") is None:
-                continue
-            try:
-                position = self._position_info_adapter.validate_python(item)
-            except ValidationError as e:
-                raise PositionUnavailableError(symbol=item.get("symbol"), exchange=self.cex_id) from e
-
-            filtered.append(position)
+        items = [item for item in data if item.get("contracts") != 0 and item.get("side") is not None]
+        # Один проход валидатора по всему списку; символ ошибки берётся из индекса в loc
+        try:
+            positions: list[CCXTPositionInfoResponse] = self._validate_position_info_list(items)
+        except ValidationError as e:
+            loc = e.errors()[0]["loc"]
+            symbol = items[loc[0]].get("symbol") if loc and type(loc[0]) is int else None
+            raise PositionUnavailableError(symbol=symbol, exchange=self.cex_id) from e
 
-        return filtered
+        return positions
 
     @override
     @map_sdk_errors
     async def close_trigger_orders(self, symbol: str, ids: list[str], params: dict[str, Any] | None = None) -> None:
-        params_ = dict(params or {})
-        params_["stop"] = True
+        # Копия параметров вызывающего кода; без параметров хватает литерала
+        params_ = {**params, "stop": True} if params else {"stop": True}
         await self._exchange.cancel_orders(symbol=symbol, ids=ids, params=params_)
 
     @override
     @map_sdk_errors
     async def get_instrument_info(self, symbol: str) -> InstrumentProtocol:
-        await self.load_markets()
+        await self._ensure_markets()
         data = self._exchange.markets.get(symbol)
         if data is None:
             raise InstrumentUnavailableError(symbol=symbol, exchange=self.cex_id)
-        dto_dict = {**data, "symbol": symbol}
+        # В ccxt рынок лежит под своим же символом: копия нужна, только если они расходятся
+        dto_dict = data if data.get("symbol") == symbol else {**data, "symbol": symbol}
         try:
-            dto = self._market_response_adapter.validate_python(dto_dict)
+            dto = self._validate_market(dto_dict)
         except ValidationError as e:
             raise InstrumentUnavailableError(symbol=symbol, exchange=self.cex_id) from e
 
@@ -242,18 +299,18 @@ class CcxtClient(CexClientPort):
     async def get_trigger_orders(self, symbol: str) -> Sequence[TriggerOrderProtocol]:
         tpsl_orders = await self._exchange.fetch_open_orders(symbol=symbol, params={"planType": "profit_loss"})
         try:
-            return self._trigger_order_list_adapter.validate_python(tpsl_orders)
+            return self._validate_trigger_order_list(tpsl_orders)
         except ValidationError as e:
             raise TriggerOrdersUnavailableError(symbol=symbol, exchange=self.cex_id) from e
 
     @override
     @map_sdk_errors
     async def get_funding_rate(self, symbol: str) -> FundingProtocol:
-        await self.load_markets()
+        await self._ensure_markets()
         data = await self._exchange.fetch_funding_rate(symbol)
         try:
-            dto = self._funding_rate_response_adapter.validate_python(data)
-        except ValidationError as e:
+            dto = FundingRateResponse.from_ccxt(data, symbol=symbol, exchange=self.cex_id)
+        except ValueError as e:
             raise FundingRateUnavailableError(symbol=symbol, exchange=self.cex_id) from e
 
         return dto
@@ -262,35 +319,41 @@ class CcxtClient(CexClientPort):
     @map_sdk_errors
     @rate_limited(weight=10)
     async def get_funding_usdt_rates(self, *, is_active: bool = True) -> Sequence[FundingProtocol]:
-        await self._exchange.load_markets()
+        await self._ensure_markets()
 
         # Фильтр доступных своп‑инструментов (:USDT) по состоянию рынка.
-        active_symbols: set[str] | None = None
+        active_symbols: frozenset[str] | None = None
         if is_active:
-            active_symbols = {
-                m.get("symbol")
-                for m in self._exchange.markets.values()
-                if (m.get("swap") is True) and m.get("symbol").endswith(":USDT") and (m.get("active") is True)
-            }
+            self._refresh_market_index()
+            active_symbols = self._active_usdt_symbols
 
         data = await self._exchange.fetch_funding_rates()
         now = datetime.now(UTC)
+        now_ms = now.timestamp() * 1000
+        normalize_symbol = FundingRateResponse.normalize_symbol
         result: list[FundingRateResponse] = []
 
         for symbol, raw in data.items():
-            if not re.match(r"^\w+\/USDT(?:\:USDT)?$", symbol):
+            # Дешёвая проверка подстроки отсекает прочие котировки до запуска regex
+            if "/USDT" not in symbol or not _USDT_SYMBOL_RE.match(symbol):
+                continue
+
+            # Фильтры по сырым данным до построения DTO: отброшенные строки не разбираются
+            if active_symbols is not None and normalize_symbol(symbol) not in active_symbols:
+                continue
+            ts = raw.get("fundingTimestamp")
+            if ts is None:
+                ts = raw.get("nextFundingTimestamp")
+            ts_is_ms = type(ts) is int or type(ts) is float
+            if ts_is_ms and ts < now_ms:
                 continue
 
-            payload = {**raw, "symbol": symbol, "exchange": self.cex_id}
             try:
-                dto = self._funding_rate_response_adapter.validate_python(payload)
-            except ValidationError as e:
+                dto = FundingRateResponse.from_ccxt(raw, symbol=symbol, exchange=self.cex_id)
+            except ValueError as e:
                 raise FundingRateUnavailableError(symbol=symbol, exchange=self.cex_id) from e
 
-            if dto.funding_date < now:
-                continue
-
-            if active_symbols is not None and dto.symbol not in active_symbols:
+            if not ts_is_ms and dto.funding_date < now:
                 continue
             result.append(dto)
 
@@ -346,7 +409,7 @@ class CcxtClient(CexClientPort):
             },
         )
         try:
-            return self._create_order_response_adapter.validate_python(data)
+            return self._validate_create_order(data)
         except ValidationError as e:
             raise OrderUnavailableError(symbol=symbol, exchange=self.cex_id) from e
 
@@ -362,13 +425,12 @@ class CcxtClient(CexClientPort):
         params: dict[str, Any] | None = None,
         margin_mode: str = "isolated",
     ) -> OrderEntityProtocol:
-        params = dict(params or {})
-        params["marginMode"] = margin_mode
+        params = {**params, "marginMode": margin_mode} if params else {"marginMode": margin_mode}
         data = await self._exchange.create_order(
             symbol=symbol, type=order_type, side=side, amount=amount, price=price, params=params
         )
         try:
-            return self._create_order_response_adapter.validate_python(data)
+            return self._validate_create_order(data)
         except ValidationError as e:
             raise OrderUnavailableError(symbol=symbol, exchange=self.cex_id) from e
 
@@ -376,7 +438,7 @@ class CcxtClient(CexClientPort):
     def price_to_precision(self, symbol: str, price: Decimal) -> Decimal:
         # ccxt может возвращать str/float; приводим к Decimal с сохранением точности
         value = self._exchange.price_to_precision(symbol=symbol, price=price)
-        return Decimal(str(value))
+        return to_decimal(value)
 
     @override
     @map_sdk_errors
@@ -384,10 +446,10 @@ class CcxtClient(CexClientPort):
         data = await self._exchange.fetch_balance()
         s_balance = data.get(coin, None)
         if s_balance is None:
-            return BalanceResponse(free=Decimal(0), used=Decimal(0), total=Decimal(0))
+            return BalanceResponse.ZERO
         try:
-            return self._balance_response_adapter.validate_python(s_balance)
-        except ValidationError as e:
+            return BalanceResponse.from_raw(s_balance)
+        except ValueError as e:
             raise BalanceUnavailableError(symbol=coin, exchange=self.cex_id) from e
 
     @override
@@ -439,6 +501,9 @@ class CcxtClient(CexClientPort):
 
         orig_request = self._origin_request
         limiter = self._rate_limiter
+        # Методы ContextVar связываются один раз: в замыкании нет поиска глобалей на запрос
+        preacquired = _preacquired.get
+        current_weight = _current_weight.get
 
         async def patched_request(
             _self: object,
@@ -450,17 +515,13 @@ class CcxtClient(CexClientPort):
             body: dict[str, object] | None = None,
             **kwargs: object,
         ) -> object:
-            if is_preacquired():  # квота уже взята
-                return await orig_request(
-                    path, api=api, method=method, params=params, headers=headers, body=body, **kwargs
-                )
-
-            if limiter is None:
+            # без лимитера контекст не читается; иначе пропускаем, если квота уже взята
+            if limiter is None or preacquired():
                 return await orig_request(
                     path, api=api, method=method, params=params, headers=headers, body=body, **kwargs
                 )
 
-            weight = get_weight() or 1  # вес из декоратора
+            weight = current_weight() or 1  # вес из декоратора
             async with await limiter.acquire(weight):
                 return await orig_request(
                     path, api=api, method=method, params=params, headers=headers, body=body, **kwargs
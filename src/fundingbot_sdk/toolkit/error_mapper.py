@@ -9,18 +9,18 @@ import asyncio
 import inspect
 import logging
 from dataclasses import dataclass
-from functools import wraps
+from functools import lru_cache, wraps
 from threading import RLock
-from typing import TYPE_CHECKING, Any, Concatenate, ParamSpec, TypeVar, overload
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Concatenate, ParamSpec, TypeVar, cast, overload
+from weakref import WeakKeyDictionary
 
 from fundingbot_sdk.contracts.ports.cex_client import CexIdentifiable
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Mapping
     from types import CoroutineType
 
-import ccxt
-import httpx
 from pydantic import ValidationError
 
 from fundingbot_sdk.contracts.errors import (
@@ -34,6 +34,52 @@ from fundingbot_sdk.contracts.errors import (
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
+def _builtin_type_map() -> Mapping[type[BaseException], tuple[type[ExchangeClientError], ErrorCode]]:
+    """Базовые правила: класс исключения -> (класс ошибки SDK, код); ищутся по MRO исключения.
+
+    Таблица общая для всех мапперов и неизменяема. ccxt и httpx импортируются при
+    первой трансляции ошибки, а не при импорте модуля: импорт ccxt заметно дорог.
+    """
+    import ccxt  # noqa: PLC0415
+    import httpx  # noqa: PLC0415
+
+    return MappingProxyType({
+        httpx.ConnectError: (RetryableExchangeError, ErrorCode.NETWORK),
+        httpx.ReadError: (RetryableExchangeError, ErrorCode.NETWORK),
+        httpx.NetworkError: (RetryableExchangeError, ErrorCode.NETWORK),
+        httpx.RemoteProtocolError: (RetryableExchangeError, ErrorCode.NETWORK),
+        httpx.TimeoutException: (RetryableExchangeError, ErrorCode.TIMEOUT),
+        asyncio.TimeoutError: (RetryableExchangeError, ErrorCode.TIMEOUT),
+        ccxt.RateLimitExceeded: (RetryableExchangeError, ErrorCode.RATE_LIMIT),
+        ccxt.NetworkError: (RetryableExchangeError, ErrorCode.RATE_LIMIT),
+        ccxt.ExchangeError: (PermanentExchangeError, ErrorCode.EXCHANGE_ERROR),
+        ValidationError: (PermanentExchangeError, ErrorCode.VALIDATION),
+    })
+
+
+# Разрешённые базовые правила по точному типу исключения (включая промахи)
+_resolved_builtin: dict[type[BaseException], tuple[type[ExchangeClientError], ErrorCode] | None] = {}
+
+
+def _resolve_builtin(exc_type: type[BaseException]) -> tuple[type[ExchangeClientError], ErrorCode] | None:
+    """Базовое правило для типа исключения: ближайший по MRO класс из таблицы.
+
+    Результат кешируется по типу: повторные ошибки того же класса не обходят MRO.
+    """
+    try:
+        return _resolved_builtin[exc_type]
+    except KeyError:
+        pass
+    type_map = _builtin_type_map()
+    entry = None
+    for cls in exc_type.__mro__:
+        entry = type_map.get(cls)
+        if entry is not None:
+            break
+    _resolved_builtin[exc_type] = entry
+    return entry
+
 
 @dataclass(slots=True)
 class ErrorContext:
@@ -50,9 +96,13 @@ class ErrorMapper:
     Предусмотрена регистрация дополнительных правил через register().
     """
 
+    # Идентификаторы правил по объекту правила; запись исчезает вместе с правилом
+    _rule_id_cache: ClassVar[WeakKeyDictionary[Callable[..., Any], tuple[str, str]]] = WeakKeyDictionary()
+
     def __init__(self) -> None:
         """Создать экземпляр маппера ошибок."""
-        self._rules: list[Callable[[BaseException, ErrorContext], SdkError | None]] = []
+        # Копирование при записи: register публикует новый кортеж, translate читает без блокировки
+        self._rules: tuple[Callable[[BaseException, ErrorContext], SdkError | None], ...] = ()
         self._rule_ids: set[tuple[str, str]] = set()
         self._lock = RLock()
 
@@ -63,50 +113,55 @@ class ErrorMapper:
         with self._lock:
             if rule_id in self._rule_ids:
                 return
-            self._rules.append(rule)
+            self._rules = (*self._rules, rule)
             self._rule_ids.add(rule_id)
 
     def translate(self, exc: BaseException, ctx: ErrorContext) -> SdkError:
-        """Преобразовать исключение внешней библиотеки в SdkError."""
-        # Пользовательские правила первыми
-        with self._lock:
-            rules_snapshot = tuple(self._rules)
+        """Преобразовать исключение внешней библиотеки в SdkError.
 
-        for rule in rules_snapshot:
+        Через этот метод проходят все ошибки обёрток ``map_sdk_errors``; подкласс
+        маппера может переопределить его.
+        """
+        # Пользовательские правила первыми
+        for rule in self._rules:
             mapped = rule(exc, ctx)
             if mapped is not None:
                 return self._enrich(mapped, ctx)
 
-        # Базовые правила по умолчанию
-        mapped: SdkError | None = None
-        if isinstance(exc, (httpx.ConnectError, httpx.ReadError, httpx.NetworkError, httpx.RemoteProtocolError)):
-            mapped = RetryableExchangeError(error_code=ErrorCode.NETWORK)
-        elif isinstance(exc, (httpx.TimeoutException, asyncio.TimeoutError)):
-            mapped = RetryableExchangeError(error_code=ErrorCode.TIMEOUT)
-        elif isinstance(exc, (ccxt.RateLimitExceeded, ccxt.NetworkError)):
-            mapped = RetryableExchangeError(error_code=ErrorCode.RATE_LIMIT)
-        elif isinstance(exc, (ccxt.ExchangeError,)):
-            mapped = PermanentExchangeError(error_code=ErrorCode.EXCHANGE_ERROR)
-        elif isinstance(exc, ValidationError):
-            mapped = PermanentExchangeError(error_code=ErrorCode.VALIDATION)
-        else:
-            mapped = UnknownExchangeError()
-
-        return self._enrich(mapped, ctx)
+        entry = _resolve_builtin(type(exc))
+        if entry is not None:
+            err_cls, code = entry
+            return self._enrich(err_cls(error_code=code), ctx)
+
+        return self._enrich(UnknownExchangeError(), ctx)
 
     @staticmethod
     def _enrich(err: SdkError, ctx: ErrorContext) -> SdkError:
-        if isinstance(err, ExchangeClientError):
-            err.exchange = ctx.exchange
-            err.symbol = ctx.symbol
-            err.method = ctx.method
+        # Флаг класса вместо isinstance: одно чтение атрибута без обхода иерархии
+        if err.needs_context:
+            client_err = cast("ExchangeClientError", err)
+            client_err.exchange = ctx.exchange
+            client_err.symbol = ctx.symbol
+            client_err.method = ctx.method
         return err
 
-    @staticmethod
-    def _rule_id(rule: Callable[[BaseException, ErrorContext], SdkError | None]) -> tuple[str, str]:
+    @classmethod
+    def _rule_id(cls, rule: Callable[[BaseException, ErrorContext], SdkError | None]) -> tuple[str, str]:
+        try:
+            cached = cls._rule_id_cache.get(rule)
+        except TypeError:  # объект без слабых ссылок или нехешируемый
+            cached = None
+        if cached is not None:
+            return cached
+
         module = getattr(rule, "__module__", "")
         qualname = getattr(rule, "__qualname__", getattr(rule, "__name__", ""))
-        return module, qualname
+        rule_id = module, qualname
+        try:
+            cls._rule_id_cache[rule] = rule_id
+        except TypeError:
+            pass
+        return rule_id
 
 
 default_error_mapper = ErrorMapper()
@@ -116,49 +171,81 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 
+_POSITIONAL_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+
+def _locate_symbol(fn: Callable[..., Any]) -> tuple[bool, int | None, Any]:
+    """Найти параметр ``symbol``: есть ли он, позиция и значение по умолчанию (один раз при декорировании).
+
+    ``symbol`` считается возможным и при ``**kwargs``. Позиция ``None`` означает,
+    что ``symbol`` передаётся только по имени или отсутствует.
+    """
+    has_var_keyword = False
+    for index, param in enumerate(inspect.signature(fn).parameters.values()):
+        if param.name == "symbol":
+            position = index if param.kind in _POSITIONAL_KINDS else None
+            default = None if param.default is inspect.Parameter.empty else param.default
+            return True, position, default
+        if param.kind is inspect.Parameter.VAR_KEYWORD:
+            has_var_keyword = True
+    return has_var_keyword, None, None
+
+
+def _map_exception(
+    exc: Exception,
+    args: tuple[Any, ...],
+    kwargs: Mapping[str, Any],
+    symbol_site: tuple[bool, int | None, Any],
+    method_name: str,
+) -> SdkError:
+    """Собрать контекст вызова, залогировать и преобразовать исключение (общая ветка except обёрток).
+
+    Возвращает ошибку SDK, а не выбрасывает её: ``raise ... from exc`` остаётся в обёртке,
+    и трассировка не получает лишнего кадра.
+    """
+    # Контекст собирается только при ошибке: успешный вызов платит лишь за try
+    exchange = getattr(args[0], "cex_id", None) if args else None
+    symbol: Any = None
+    has_symbol, symbol_pos, symbol_default = symbol_site
+    if has_symbol:  # методы без symbol (баланс и т.п.) не ищут его в аргументах
+        symbol = kwargs.get(
+            "symbol",
+            args[symbol_pos] if symbol_pos is not None and len(args) > symbol_pos else symbol_default,
+        )
+    if logger.isEnabledFor(logging.ERROR):
+        logger.exception("Исключение на границе SDK: %s.%s", exchange, method_name)
+    ctx = ErrorContext(exchange=exchange, symbol=symbol, method=method_name)
+    return default_error_mapper.translate(exc, ctx)
+
+
 def _wrap_sync[**P, R](fn: Callable[P, R]) -> Callable[P, R]:
-    sig = inspect.signature(fn)
+    symbol_site = _locate_symbol(fn)
     method_name = getattr(fn, "__name__", "unknown")
 
     @wraps(fn)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        self_obj = args[0] if args else None
-        exchange = getattr(self_obj, "cex_id", None)
-        bound = sig.bind_partial(*args, **kwargs)
-        bound.apply_defaults()
-        symbol = bound.arguments.get("symbol", None)
         try:
             return fn(*args, **kwargs)
         except SdkError:
             raise
         except Exception as exc:
-            ctx = ErrorContext(exchange=exchange, symbol=symbol, method=method_name)
-            logger.exception("Исключение на границе SDK: %s.%s", exchange, method_name)
-            raise default_error_mapper.translate(exc, ctx) from exc
+            raise _map_exception(exc, args, kwargs, symbol_site, method_name) from exc
 
     return wrapper
 
 
 def _wrap_async[**P, R](fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
-    sig = inspect.signature(fn)
+    symbol_site = _locate_symbol(fn)
     method_name = getattr(fn, "__name__", "unknown")
 
     @wraps(fn)
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        self_obj = args[0] if args else None
-        exchange = getattr(self_obj, "cex_id", None)
-        bound = sig.bind_partial(*args, **kwargs)
-        bound.apply_defaults()
-        symbol = bound.arguments.get("symbol", None)
         try:
             return await fn(*args, **kwargs)
         except SdkError:
             raise
         except Exception as exc:
-            ctx = ErrorContext(exchange=exchange, symbol=symbol, method=method_name)
-            logger.exception("Исключение на границе SDK: %s.%s", exchange, method_name)
-            t_ecx = default_error_mapper.translate(exc, ctx)
-            raise t_ecx from exc
+            raise _map_exception(exc, args, kwargs, symbol_site, method_name) from exc
 
     return wrapper
 
@@ -180,6 +267,11 @@ def map_sdk_errors[**P, R, T: CexIdentifiable](
 
     Сохраняет тип функции (включая async/sync форму) и добавляет маппинг ошибок.
     """
+    # Флаг CO_COROUTINE в коде функции покрывает обычные async def; прочие объекты
+    # (partial, markcoroutinefunction и т.п.) проверяются через inspect
+    code = getattr(fn, "__code__", None)
+    if code is not None and code.co_flags & inspect.CO_COROUTINE:
+        return _wrap_async(cast("Callable[Concatenate[T, P], Awaitable[R]]", fn))
     if inspect.iscoroutinefunction(fn):
         return _wrap_async(fn)
     return _wrap_sync(fn)